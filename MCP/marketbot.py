@@ -12,51 +12,106 @@ creating a record so downstream dashboards group intelligence correctly.
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import gzip
 import json
 import os
+import re
+import time
 from pathlib import Path
 import urllib.parse
-import urllib.request
-from typing import Any, Dict, Optional, Sequence
-
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional; stdlib json is the fallback encoder
+    orjson = None
+
+import aiohttp
+import anyio
 from mcp.server.fastmcp import FastMCP
 
-mcp = FastMCP("marketbot")
+
+@asynccontextmanager
+async def _lifespan(_server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
+    """Close the shared HTTP session when the MCP server shuts down."""
+
+    try:
+        yield {}
+    finally:
+        if _SESSION is not None and not _SESSION.closed:
+            await _SESSION.close()
+
+
+mcp = FastMCP("marketbot", lifespan=_lifespan)
 
 # Configuration mirrors the ProductBotAI deployment exposed via ngrok.
 _DEFAULT_BASE_URL = "http://localhost:3000/api/marketbot"
 _ENV_FILE = Path(os.getenv("MARKETBOT_ENV_FILE", "/workspace/.marketbot.env"))
+# Fixed .env fallbacks, resolved once; dict.fromkeys drops the duplicate when
+# _ENV_FILE is the /workspace default.
+_ENV_CANDIDATES: Tuple[Path, ...] = tuple(
+    dict.fromkeys(
+        (
+            _ENV_FILE,
+            Path("/workspace/.marketbot.env"),
+            Path(__file__).resolve().parent.parent / ".marketbot.env",
+            Path("/opt/codex-home/.marketbot.env"),
+        )
+    )
+)
+_SESSIONS_ROOT = Path("/opt/codex-home/sessions")
+
+
+# One KEY=VALUE assignment per line; blank lines, comments (#) and lines
+# without "=" never match. Surrounding whitespace is trimmed from both sides.
+_ENV_LINE = re.compile(r"^[ \t]*([^#\s=][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.MULTILINE)
+
+
+# Parsed .marketbot.env values; None until a candidate file yields any.
+_ENV_VALUES: Optional[Dict[str, str]] = None
 
 
 def _read_env_file() -> Dict[str, str]:
-    """Parse .marketbot.env for fallback configuration."""
-
-    candidates: Sequence[Path] = [
-        Path(os.getenv("MARKETBOT_ENV_FILE", "")),
-        _ENV_FILE,
-        Path("/workspace/.marketbot.env"),
-        Path(__file__).resolve().parent.parent / ".marketbot.env",
-        Path("/opt/codex-home/.marketbot.env"),
-    ]
+    """Parse .marketbot.env for fallback configuration.
 
+    Parsed once per process; `marketbot_reload_env` clears the cache after edits.
+    An empty result is not kept, so a file written after startup is still found.
+    """
+
+    global _ENV_VALUES
+    if _ENV_VALUES is not None:
+        return _ENV_VALUES
+
+    candidates: List[Path] = []
+    env_file = os.getenv("MARKETBOT_ENV_FILE")
+    if env_file:
+        candidates.append(Path(env_file))
+    candidates.extend(_ENV_CANDIDATES)
     session_id = os.getenv("CODEX_SESSION_ID")
-    sessions_root = Path("/opt/codex-home/sessions")
     if session_id:
-        candidates.append(sessions_root / session_id / ".env")
-    candidates.append(sessions_root / "unknown" / ".env")
+        candidates.append(_SESSIONS_ROOT / session_id / ".env")
+    candidates.append(_SESSIONS_ROOT / "unknown" / ".env")
 
     values: Dict[str, str] = {}
     for candidate in candidates:
-        if not candidate or not candidate.is_file():
+        # Just try the read: most candidates are absent, and a failed open costs
+        # one syscall where is_file() + read_text() cost two on a hit.
+        try:
+            text = candidate.read_text()
+        except (OSError, UnicodeDecodeError):
             continue
-        for raw_line in candidate.read_text().splitlines():
-            line = raw_line.strip()
-            if not line or line.startswith("#") or "=" not in line:
-                continue
-            key, value = line.split("=", 1)
-            values.setdefault(key.strip(), value.strip())
+        for key, value in _ENV_LINE.findall(text):
+            values.setdefault(key, value)
         if values:
             break
+    if values:
+        _ENV_VALUES = values
     return values
 
 
@@ -66,59 +121,201 @@ def _resolve_setting(name: str, default: Optional[str] = None) -> Optional[str]:
     return os.getenv(name) or _read_env_file().get(name) or default
 
 
+def _flag_setting(name: str) -> bool:
+    """Boolean setting: enabled only when set to "1"."""
+
+    return _resolve_setting(name, "0") == "1"
+
+
+def _float_setting(name: str, default: float) -> float:
+    """Numeric setting; unset or malformed values fall back to ``default``."""
+
+    try:
+        return float(_resolve_setting(name) or default)
+    except ValueError:
+        return default
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a request body straight to UTF-8 JSON bytes."""
+
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Parse a response body straight from bytes (no intermediate str decode)."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class MarketBotError(RuntimeError):
     """Raised when the MarketBot API returns an error."""
 
 
+# Failures a tool reports back to the agent: API errors, transport/timeout
+# errors and timeouts, and undecodable JSON. Anything else is a bug and should
+# surface instead of being swallowed.
+_TOOL_ERRORS = (MarketBotError, aiohttp.ClientError, asyncio.TimeoutError, OSError, ValueError)
+
+
+_DEBUG_STATIC: Optional[Dict[str, Optional[str]]] = None
+
+
 def _debug_info() -> Dict[str, Optional[str]]:
-    """Return non-sensitive context for tool responses."""
-
-    api_key = _resolve_setting("MARKETBOT_API_KEY", "")
-    suffix: Optional[str] = api_key[-4:] if api_key else None
-    return {
-        "base_url": _resolve_setting("MARKETBOT_API_URL", _DEFAULT_BASE_URL),
-        "team_id": _resolve_setting("MARKETBOT_TEAM_ID", ""),
-        "api_key_suffix": suffix,
-    }
+    """Return non-sensitive context for tool responses.
+
+    The settings behind it are fixed for the life of the process, so they are
+    resolved once and the same dict is shared by every response. Callers must
+    not mutate it; copy first when adding fields.
+    """
+
+    global _DEBUG_STATIC
+    if _DEBUG_STATIC is None:
+        api_key = _resolve_setting("MARKETBOT_API_KEY", "")
+        suffix: Optional[str] = api_key[-4:] if api_key else None
+        _DEBUG_STATIC = {
+            "base_url": _resolve_setting("MARKETBOT_API_URL", _DEFAULT_BASE_URL),
+            "team_id": _resolve_setting("MARKETBOT_TEAM_ID", ""),
+            "api_key_suffix": suffix,
+        }
+    return _DEBUG_STATIC
+
+
+_DEBUG_ENABLED = _flag_setting("MARKETBOT_DEBUG")
+
+
+def _maybe_debug(payload: Any) -> None:
+    """Attach debug context to a successful payload when MARKETBOT_DEBUG=1."""
+
+    if _DEBUG_ENABLED and isinstance(payload, dict):
+        payload.setdefault("debug", _debug_info())
+
+
+def _clean(**values: Any) -> Dict[str, Any]:
+    """Build query params or a JSON body, leaving out values the caller did not supply (None)."""
+
+    return {key: value for key, value in values.items() if value is not None}
+
+
+def _as_list(value: Optional[Sequence[Any]]) -> Sequence[Any]:
+    """Return ``value`` as a sequence, copying only when it is not already a list/tuple."""
+
+    if isinstance(value, (list, tuple)):
+        return value
+    return [] if value is None else list(value)
 
 
 def _with_next_actions(resp: Dict[str, Any], actions: Optional[Sequence[Dict[str, Any]]] = None) -> Dict[str, Any]:
     """Ensure every response carries next_actions (default: empty list)."""
 
-    if actions is None:
-        actions = []
     if isinstance(resp, dict) and "next_actions" not in resp:
-        resp["next_actions"] = list(actions)
+        resp["next_actions"] = list(actions) if actions else []
     return resp
 
 
-def _request(
-    method: str,
-    path: str,
-    *,
-    params: Optional[Dict[str, Any]] = None,
-    body: Optional[Dict[str, Any]] = None,
-) -> Dict[str, Any]:
-    """Make an HTTP request to the MarketBot API."""
+def _tool(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Dict[str, Any]]]:
+    """Wrap a tool body with the shared debug/next_actions/error envelope.
+
+    The body just returns the API payload (or raises); failures listed in
+    `_TOOL_ERRORS` become ``{"success": False, "error": ...}`` responses.
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+        try:
+            payload = await fn(*args, **kwargs)
+        except _TOOL_ERRORS as err:
+            return _with_next_actions({"success": False, "error": str(err), "debug": _debug_info()})
+        _maybe_debug(payload)
+        return _with_next_actions(payload)
+
+    return wrapper
+
+
+_REQUEST_TIMEOUT = 30
+# Opt-in gzip for large request bodies; the API must accept Content-Encoding: gzip.
+_GZIP_REQUESTS = _flag_setting("MARKETBOT_GZIP_REQUESTS")
+_COMPRESS_MIN_BYTES = 1024
+# Transient gateway errors are retried for idempotent GETs only, with
+# exponential backoff (0.2s, 0.4s, 0.8s).
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_RETRY_ATTEMPTS = 3
+_RETRY_BACKOFF = 0.2
+# Pool sizing: one agent drives these tools, but gathered calls can fan out.
+# Idle sockets are dropped after 30s, ahead of the 60s idle timeout common on
+# load balancers/tunnels, so a reused connection is never one the LB already cut.
+_POOL_LIMIT = 20
+_POOL_LIMIT_PER_HOST = 10
+_POOL_KEEPALIVE = 30
+# Resolved API host addresses are reused for this long (aiohttp default: 10s).
+_DNS_CACHE_TTL = 300
+_SESSION: Optional[aiohttp.ClientSession] = None
+# Last ETag + parsed body per GET URL (path and query), so steady-state polls
+# are answered with 304 Not Modified instead of a full body. LRU-bounded.
+_ETAG_CACHE_MAX = 256
+_ETAG_CACHE: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+# GETs currently on the wire, keyed by full URL and cache generation
+# (single-flight). A GET issued after a write never joins one from before it.
+_INFLIGHT: Dict[Tuple[str, int], "asyncio.Task[Any]"] = {}
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """Return the process-wide session so calls share one keep-alive connection pool."""
+
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        connector = aiohttp.TCPConnector(
+            limit=_POOL_LIMIT,
+            limit_per_host=_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=_POOL_KEEPALIVE,
+            ttl_dns_cache=_DNS_CACHE_TTL,
+        )
+        _SESSION = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT),
+        )
+    return _SESSION
+
+
+def _shallow_copy(payload: Any) -> Any:
+    """Copy a response so callers can decorate it without touching cached state."""
+
+    return dict(payload) if isinstance(payload, dict) else payload
+
+
+@dataclass(frozen=True)
+class _ApiConfig:
+    """Connection settings resolved once per process (see `_config`)."""
+
+    base_url: str
+    headers: Mapping[str, str]
+
+
+@functools.lru_cache(maxsize=1)
+def _config() -> _ApiConfig:
+    """Resolve the base URL and static request headers once per process.
+
+    Raises MarketBotError (and caches nothing) while credentials are missing.
+    """
 
     api_key = _resolve_setting("MARKETBOT_API_KEY")
     team_id = _resolve_setting("MARKETBOT_TEAM_ID")
     base_url = (_resolve_setting("MARKETBOT_API_URL", _DEFAULT_BASE_URL) or _DEFAULT_BASE_URL).rstrip("/")
 
     if not api_key:
-        raise MarketBotError("MARKETBOT_API_KEY is not set (set env or /workspace/.marketbot.env)")
+        raise MarketBotError(
+            "MARKETBOT_API_KEY is not set (set env or /workspace/.marketbot.env, then call marketbot_reload_env)"
+        )
     if not team_id:
-        raise MarketBotError("MARKETBOT_TEAM_ID is not set (set env or /workspace/.marketbot.env)")
+        raise MarketBotError(
+            "MARKETBOT_TEAM_ID is not set (set env or /workspace/.marketbot.env, then call marketbot_reload_env)"
+        )
 
     base = base_url or _DEFAULT_BASE_URL
-    url = f"{base.rstrip('/')}/{path.lstrip('/')}"
-    if params:
-        query_params = {k: v for k, v in params.items() if v is not None}
-        if query_params:
-            query = urllib.parse.urlencode(query_params)
-            url = f"{url}?{query}"
-
-    data = None
     headers = {
         "Accept": "application/json",
         "Authorization": f"Bearer {api_key}",
@@ -127,47 +324,206 @@ def _request(
     }
     if "ngrok" in base:
         headers["ngrok-skip-browser-warning"] = "true"
-    if body is not None:
-        data = json.dumps(body).encode("utf-8")
-        headers["Content-Type"] = "application/json"
+    return _ApiConfig(base_url=base, headers=MappingProxyType(headers))
+
+
+async def _send(method: str, url: str, data: Optional[bytes], headers: Mapping[str, str]) -> Any:
+    """Perform one API exchange: conditional GET, gateway retries, status check, decode."""
+
+    cached = _ETAG_CACHE.get(url) if method == "GET" else None
+    if cached is not None:
+        headers = {**headers, "If-None-Match": cached[0]}
+
+    attempt = 0
+    while True:
+        async with _get_session().request(method, url, data=data, headers=headers) as resp:
+            payload = await resp.read()
+            status = resp.status
+            etag = resp.headers.get("ETag")
+        if status in _RETRY_STATUSES and method == "GET" and attempt < _RETRY_ATTEMPTS:
+            await asyncio.sleep(_RETRY_BACKOFF * (2 ** attempt))
+            attempt += 1
+            continue
+        break
+
+    if status == 304 and cached is not None:
+        _ETAG_CACHE.move_to_end(url)
+        return _shallow_copy(cached[1])
+    if status >= 400:
+        raise MarketBotError(f"HTTP {status}: {payload.decode('utf-8', 'replace')}")
+    parsed = _loads(payload)
+    if method == "GET" and etag:
+        _ETAG_CACHE[url] = (etag, _shallow_copy(parsed))
+        _ETAG_CACHE.move_to_end(url)
+        if len(_ETAG_CACHE) > _ETAG_CACHE_MAX:
+            _ETAG_CACHE.popitem(last=False)
+    return parsed
+
+
+def _forget_inflight(key: Tuple[str, int], task: "asyncio.Task[Any]") -> None:
+    if _INFLIGHT.get(key) is task:
+        del _INFLIGHT[key]
+    if not task.cancelled():
+        task.exception()  # Mark retrieved even if every waiter was cancelled.
+
+
+async def _request(
+    method: str,
+    path: str,
+    *,
+    params: Optional[Dict[str, Any]] = None,
+    body: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Make an HTTP request to the MarketBot API.
+
+    ``params`` must already be free of None values (build them with `_clean`).
 
-    req = urllib.request.Request(url, data=data, headers=headers, method=method.upper())
+    Identical GETs issued while one is already in flight share its result
+    instead of opening another round-trip.
+    """
+
+    config = _config()
+    headers = config.headers
+    url = f"{config.base_url}/{path.lstrip('/')}"
+    if params:
+        url = f"{url}?{urllib.parse.urlencode(params)}"
+
+    data = None
+    if body is not None:
+        data = _dumps(body)
+        headers = {**headers, "Content-Type": "application/json"}
+        if _GZIP_REQUESTS and len(data) >= _COMPRESS_MIN_BYTES:
+            data = gzip.compress(data, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
+
+    method = method.upper()
+    if method != "GET":
+        payload = await _send(method, url, data, headers)
+        # A successful write makes cached reads of the same resource stale.
+        _invalidate_cache("/" + path.lstrip("/").split("/", 1)[0].split("?", 1)[0])
+        return payload
+
+    key = (url, _CACHE_GENERATION)
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_send(method, url, data, headers))
+        _INFLIGHT[key] = task
+        task.add_done_callback(functools.partial(_forget_inflight, key))
+    # shield: one caller being cancelled must not cancel the fetch others await.
+    return _shallow_copy(await asyncio.shield(task))
+
+
+# Short-lived cache for read-mostly list and detail endpoints that agents tend to re-query
+# with identical arguments while planning. Keyed on (path, sorted params).
+# Within ``ttl`` an entry is served as-is; for a further ``swr`` seconds it is
+# served stale while a background task refreshes it.
+_LIST_CACHE_TTL = _float_setting("MARKETBOT_CACHE_TTL", 5.0)
+_LIST_CACHE_SWR = 30.0
+_TRENDS_CACHE_TTL = 30.0
+_TRENDS_CACHE_SWR = 300.0
+_RESPONSE_CACHE_MAX = 256
+_CacheKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
+_RESPONSE_CACHE: Dict[_CacheKey, Tuple[float, Dict[str, Any]]] = {}
+_CACHE_REFRESHES: Dict[_CacheKey, "asyncio.Task[Any]"] = {}
+# Bumped by every invalidation. A fetch that overlapped one may have read
+# pre-write data, so it is returned to its caller but not cached.
+_CACHE_GENERATION = 0
+
+
+async def _fetch_into_cache(key: _CacheKey, path: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    generation = _CACHE_GENERATION
+    payload = await _request("GET", path, params=params)
+    if isinstance(payload, dict) and generation == _CACHE_GENERATION:
+        if key not in _RESPONSE_CACHE and len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAX:
+            _RESPONSE_CACHE.pop(next(iter(_RESPONSE_CACHE)))
+        _RESPONSE_CACHE[key] = (time.monotonic(), dict(payload))
+    return payload
+
+
+async def _refresh_cache_entry(key: _CacheKey, path: str, params: Optional[Dict[str, Any]]) -> None:
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:  # type: ignore[no-untyped-call]
-            payload = resp.read().decode("utf-8")
-            if resp.status >= 400:
-                raise MarketBotError(payload)
-            return json.loads(payload)
-    except urllib.error.HTTPError as exc:  # type: ignore[attr-defined]
-        detail = exc.read().decode("utf-8")
-        raise MarketBotError(f"HTTP {exc.code}: {detail}") from exc
+        await _fetch_into_cache(key, path, params)
+    except _TOOL_ERRORS:
+        pass  # Keep serving the stale entry; the next caller past the window refetches.
+    finally:
+        _CACHE_REFRESHES.pop(key, None)
 
 
-@mcp.tool()
-async def marketbot_ping() -> Dict[str, Any]:
-    """Ping the MarketBot API and report the base URL in use.
+async def _cached_get(
+    path: str,
+    params: Optional[Dict[str, Any]] = None,
+    ttl: Optional[float] = None,
+    swr: float = _LIST_CACHE_SWR,
+) -> Dict[str, Any]:
+    """GET ``path`` through the response cache (fresh, stale-while-revalidate, or fetched).
 
-    Returns the resolved base URL and health check response (or error).
+    ``ttl`` defaults to the current `_LIST_CACHE_TTL` (it can change on reload).
+    """
+
+    if ttl is None:
+        ttl = _LIST_CACHE_TTL
+    key = (path, tuple(sorted((params or {}).items())))
+    entry = _RESPONSE_CACHE.get(key)
+    status = "MISS"
+    if entry is not None:
+        age = time.monotonic() - entry[0]
+        if age < ttl:
+            status = "HIT"
+        elif age < ttl + swr:
+            status = "STALE"
+            if key not in _CACHE_REFRESHES:
+                _CACHE_REFRESHES[key] = asyncio.create_task(_refresh_cache_entry(key, path, params))
+
+    payload = await _fetch_into_cache(key, path, params) if status == "MISS" else dict(entry[1])
+    if _DEBUG_ENABLED and isinstance(payload, dict):
+        payload["debug"] = {**payload.get("debug", _debug_info()), "cache": status}
+    return payload
+
+
+def _invalidate_cache(prefix: str) -> None:
+    """Drop cached responses whose path starts with ``prefix``.
+
+    `_request` calls this for the written resource after every successful
+    non-GET; tools only need it for cross-resource effects.
     """
+
+    global _CACHE_GENERATION
+    _CACHE_GENERATION += 1
+    for key in [key for key in _RESPONSE_CACHE if key[0].startswith(prefix)]:
+        del _RESPONSE_CACHE[key]
+
+
+async def _health_response() -> Dict[str, Any]:
+    """Shared body for the ping/health tools: GET /health plus base URL context."""
+
     try:
-        response = _request("GET", "/health")
+        response = await _request("GET", "/health")
         if isinstance(response, dict):
             response.setdefault("base_url", _resolve_setting("MARKETBOT_API_URL", _DEFAULT_BASE_URL))
             response.setdefault("debug", _debug_info())
         else:
             response = {"success": True, "data": response, "debug": _debug_info()}
         return _with_next_actions(response)
-    except Exception as err:
+    except _TOOL_ERRORS as err:
         return _with_next_actions(
             {
                 "success": False,
+                "error": str(err),
                 "base_url": _resolve_setting("MARKETBOT_API_URL", _DEFAULT_BASE_URL),
                 "debug": _debug_info(),
-                "error": str(err),
             }
         )
 
 
+@mcp.tool()
+async def marketbot_ping() -> Dict[str, Any]:
+    """Ping the MarketBot API and report the base URL in use.
+
+    Returns the resolved base URL and health check response (or error).
+    """
+    return await _health_response()
+
+
 @mcp.tool()
 async def marketbot_health() -> Dict[str, Any]:
     """Return the MarketBot API health check.
@@ -176,26 +532,36 @@ async def marketbot_health() -> Dict[str, Any]:
     ProductBotAI MarketBot service. Override MARKETBOT_API_URL if you're not on
     the default localhost/ngrok tunnel.
     """
-    try:
-        response = _request("GET", "/health")
-        if isinstance(response, dict):
-            response.setdefault("base_url", _resolve_setting("MARKETBOT_API_URL", _DEFAULT_BASE_URL))
-            response.setdefault("debug", _debug_info())
-        else:
-            response = {"success": True, "data": response, "debug": _debug_info()}
-        return _with_next_actions(response)
-    except Exception as err:
-        return _with_next_actions(
-            {
-                "success": False,
-                "error": str(err),
-                "base_url": _resolve_setting("MARKETBOT_API_URL", _DEFAULT_BASE_URL),
-                "debug": _debug_info(),
-            }
-        )
+    return await _health_response()
+
+
+@mcp.tool()
+async def marketbot_reload_env() -> Dict[str, Any]:
+    """Re-read .marketbot.env after editing it (API key, team, base URL).
+
+    Settings are cached for the life of the MCP process; call this instead of
+    restarting when credentials or MARKETBOT_API_URL change on disk. Cached
+    responses are dropped too, since they may belong to the previous team.
+    """
+    global _ENV_VALUES, _DEBUG_STATIC, _DEBUG_ENABLED, _GZIP_REQUESTS, _LIST_CACHE_TTL
+    _ENV_VALUES = None
+    _config.cache_clear()
+    _DEBUG_STATIC = None
+    _DEBUG_ENABLED = _flag_setting("MARKETBOT_DEBUG")
+    _GZIP_REQUESTS = _flag_setting("MARKETBOT_GZIP_REQUESTS")
+    _LIST_CACHE_TTL = _float_setting("MARKETBOT_CACHE_TTL", 5.0)
+
+    for task in _CACHE_REFRESHES.values():
+        task.cancel()
+    _CACHE_REFRESHES.clear()
+    _invalidate_cache("")
+    _ETAG_CACHE.clear()
+    _INFLIGHT.clear()
+    return _with_next_actions({"success": True, "debug": _debug_info()})
 
 
 @mcp.tool()
+@_tool
 async def list_competitors(
     industry: Optional[str] = None,
     status: Optional[str] = None,
@@ -212,21 +578,12 @@ async def list_competitors(
     Reminder: each entry represents a single company with a canonical "common name".
     Reuse that name when creating activities to avoid duplicates.
     """
-    try:
-        params = {
-            "industry": industry,
-            "status": status,
-            "limit": limit,
-            "offset": offset,
-        }
-        payload = _request("GET", "/competitors", params=params)
-        payload.setdefault("debug", _debug_info())
-        return _with_next_actions(payload)
-    except Exception as err:
-        return _with_next_actions({"success": False, "error": str(err), "debug": _debug_info()})
+    params = _clean(industry=industry, status=status, limit=limit, offset=offset)
+    return await _cached_get("/competitors", params=params)
 
 
 @mcp.tool()
+@_tool
 async def create_competitor(
     name: str,
     website: str,
@@ -249,24 +606,21 @@ async def create_competitor(
     Always reuse the same `name` (common name) so deduplication is effortless. If the
     company already exists, `list_competitors` can help you find the canonical slug.
     """
-    try:
-        body = {
-            "name": name,
-            "website": website,
-            "industry": industry,
-            "status": status,
-            "logo_url": logo_url,
-            "summary": summary,
-            "competes_with_ids": list(competes_with_ids) if competes_with_ids else None,
-        }
-        payload = _request("POST", "/competitors", body=body)
-        payload.setdefault("debug", _debug_info())
-        return _with_next_actions(payload)
-    except Exception as err:
-        return _with_next_actions({"success": False, "error": str(err), "debug": _debug_info()})
+    body = _clean(
+        name=name,
+        website=website,
+        industry=industry,
+        status=status,
+        logo_url=logo_url,
+        summary=summary,
+    )
+    if competes_with_ids:
+        body["competes_with_ids"] = _as_list(competes_with_ids)
+    return await _request("POST", "/competitors", body=body)
 
 
 @mcp.tool()
+@_tool
 async def get_competitor_detail(competitor_id: str) -> Dict[str, Any]:
     """Fetch one company plus up to five recent activities.
 
@@ -275,15 +629,11 @@ async def get_competitor_detail(competitor_id: str) -> Dict[str, Any]:
 
     Returns the metadata block plus `recent_activities` for storyboarded cards.
     """
-    try:
-        payload = _request("GET", f"/competitors/{competitor_id}")
-        payload.setdefault("debug", _debug_info())
-        return _with_next_actions(payload)
-    except Exception as err:
-        return _with_next_actions({"success": False, "error": str(err), "debug": _debug_info()})
+    return await _cached_get(f"/competitors/{competitor_id}")
 
 
 @mcp.tool()
+@_tool
 async def list_activities(
     competitor_id: Optional[str] = None,
     category: Optional[str] = None,
@@ -291,6 +641,7 @@ async def list_activities(
     search: Optional[str] = None,
     limit: int = 20,
     offset: int = 0,
+    cursor: Optional[str] = None,
 ) -> Dict[str, Any]:
     """List or search activities tied to tracked companies.
 
@@ -300,24 +651,41 @@ async def list_activities(
         time_range_days: quick lookback filtering.
         search: semantic search term (uses Chroma similarity).
         limit/offset: Pagination controls.
+        cursor: `next_cursor` from a previous page. Prefer it over `offset` when
+            paging deep into history; `offset` is ignored when a cursor is given.
     """
-    try:
-        params = {
-            "competitor_id": competitor_id,
-            "category": category,
-            "time_range_days": time_range_days,
-            "search": search,
-            "limit": limit,
-            "offset": offset,
-        }
-        payload = _request("GET", "/activities", params=params)
-        payload.setdefault("debug", _debug_info())
-        return _with_next_actions(payload)
-    except Exception as err:
-        return _with_next_actions({"success": False, "error": str(err), "debug": _debug_info()})
+    params = _clean(
+        competitor_id=competitor_id,
+        category=category,
+        time_range_days=time_range_days,
+        search=search,
+        limit=limit,
+        offset=offset if cursor is None else None,
+        cursor=cursor,
+    )
+    payload = await _cached_get("/activities", params=params)
+    actions = None
+    next_cursor = payload.get("next_cursor") if isinstance(payload, dict) else None
+    if next_cursor:
+        actions = [
+            {
+                "tool": "list_activities",
+                "arguments": _clean(
+                    competitor_id=competitor_id,
+                    category=category,
+                    time_range_days=time_range_days,
+                    search=search,
+                    limit=limit,
+                    cursor=next_cursor,
+                ),
+                "reason": "Fetch the next page of activities (pass cursor, not offset).",
+            }
+        ]
+    return _with_next_actions(payload, actions)
 
 
 @mcp.tool()
+@_tool
 async def create_activity(
     competitor_id: str,
     title: str,
@@ -343,42 +711,101 @@ async def create_activity(
     Tip: omit `detected_at` unless you have a precise timestamp—MarketBot will fill in
     the current time, avoiding malformed values.
     """
-    try:
-        body = {
-            "competitor_id": competitor_id,
-            "title": title,
-            "description": description,
-            "category": category,
-            "source_url": source_url,
-            "source_type": source_type,
-            "detected_at": detected_at,
-            "published_at": published_at,
-            "confidence_score": confidence_score,
-            "is_verified": is_verified,
+    body = _clean(
+        competitor_id=competitor_id,
+        title=title,
+        description=description,
+        category=category,
+        source_url=source_url,
+        source_type=source_type,
+        detected_at=detected_at,
+        published_at=published_at,
+        confidence_score=confidence_score,
+        is_verified=is_verified,
+    )
+    payload = await _request("POST", "/activities", body=body)
+    # New activities show up in the competitor's detail and can raise alerts.
+    _invalidate_cache(f"/competitors/{competitor_id}")
+    _invalidate_cache("/alerts")
+    return payload
+
+
+# Concurrent POSTs allowed per create_activities call (stays under the pool's per-host limit).
+_BULK_CONCURRENCY = 8
+
+
+@mcp.tool()
+@_tool
+async def create_activities(activities: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """Append many activities in one tool call (e.g., everything from one feed crawl).
+
+    Args:
+        activities: Activity objects using the same fields as `create_activity`.
+            Each needs `competitor_id` and `title`; `category` defaults to "News".
+
+    Items are posted concurrently (a few at a time), so N activities cost roughly
+    N/8 round-trips of wall time instead of N. `results` keeps the input order and
+    reports success/error per item, so partial failures can be retried.
+    """
+    items = _as_list(activities)
+    invalid = [
+        index
+        for index, item in enumerate(items)
+        if not isinstance(item, dict) or not item.get("competitor_id") or not item.get("title")
+    ]
+    if invalid:
+        return {
+            "success": False,
+            "error": f"activities at positions {invalid} need competitor_id and title",
+            "debug": _debug_info(),
         }
-        payload = _request("POST", "/activities", body=body)
-        payload.setdefault("debug", _debug_info())
-        return _with_next_actions(payload)
-    except Exception as err:
-        return _with_next_actions({"success": False, "error": str(err), "debug": _debug_info()})
+
+    semaphore = asyncio.Semaphore(_BULK_CONCURRENCY)
+
+    async def _create(item: Dict[str, Any]) -> Dict[str, Any]:
+        body = {"category": "News", "is_verified": False, **_clean(**item)}
+        async with semaphore:
+            return await _request("POST", "/activities", body=body)
+
+    outcomes = await asyncio.gather(*(_create(item) for item in items), return_exceptions=True)
+    results: List[Any] = []
+    failed = 0
+    for item, outcome in zip(items, outcomes):
+        if isinstance(outcome, _TOOL_ERRORS):
+            failed += 1
+            results.append({"success": False, "error": str(outcome)})
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            results.append(outcome)
+            _invalidate_cache(f"/competitors/{item['competitor_id']}")
+    if failed < len(items):
+        _invalidate_cache("/alerts")
+
+    response: Dict[str, Any] = {
+        "success": failed == 0,
+        "created": len(items) - failed,
+        "failed": failed,
+        "results": results,
+    }
+    if failed:
+        response["debug"] = _debug_info()
+    return response
 
 
 @mcp.tool()
+@_tool
 async def list_trends(limit: int = 10) -> Dict[str, Any]:
     """Return trending keywords extracted from all competitor activities.
 
     Args:
         limit: Number of ranked keywords to fetch (default 10).
     """
-    try:
-        payload = _request("GET", "/trends", params={"limit": limit})
-        payload.setdefault("debug", _debug_info())
-        return _with_next_actions(payload)
-    except Exception as err:
-        return _with_next_actions({"success": False, "error": str(err), "debug": _debug_info()})
+    return await _cached_get("/trends", params={"limit": limit}, ttl=_TRENDS_CACHE_TTL, swr=_TRENDS_CACHE_SWR)
 
 
 @mcp.tool()
+@_tool
 async def recompute_trends(top_n: int = 25, lookback_days: int = 180) -> Dict[str, Any]:
     """Recompute trending keywords from activities and return the updated list.
 
@@ -390,43 +817,69 @@ async def recompute_trends(top_n: int = 25, lookback_days: int = 180) -> Dict[st
         - Calls POST /api/trends/recompute under the hood.
         - After recompute, GET /api/trends will reflect the new rankings.
     """
-    try:
-        body = {"top_n": top_n, "lookback_days": lookback_days}
-        payload = _request("POST", "/trends", body=body)
-        payload.setdefault("debug", _debug_info())
-        return _with_next_actions(payload)
-    except Exception as err:
-        return _with_next_actions({"success": False, "error": str(err), "debug": _debug_info()})
+    body = {"top_n": top_n, "lookback_days": lookback_days}
+    return await _request("POST", "/trends", body=body)
 
 
 @mcp.tool()
+@_tool
 async def list_alerts(unread_only: bool = False) -> Dict[str, Any]:
     """List alert records (optionally unread only).
 
     Args:
         unread_only: True to fetch only unread alerts (UI badge scenario).
     """
-    try:
-        params = {"unread_only": str(bool(unread_only)).lower()}
-        payload = _request("GET", "/alerts", params=params)
-        payload.setdefault("debug", _debug_info())
-        return _with_next_actions(payload)
-    except Exception as err:
-        return _with_next_actions({"success": False, "error": str(err), "debug": _debug_info()})
+    params = {"unread_only": str(bool(unread_only)).lower()}
+    return await _cached_get("/alerts", params=params)
 
 
 @mcp.tool()
+@_tool
 async def update_alert(alert_id: str, is_read: bool = True) -> Dict[str, Any]:
     """Mark an alert read/unread."""
-    try:
-        body = {"is_read": is_read}
-        payload = _request("PATCH", f"/alerts/{alert_id}", body=body)
-        payload.setdefault("debug", _debug_info())
-        return _with_next_actions(payload)
-    except Exception as err:
-        return _with_next_actions({"success": False, "error": str(err), "debug": _debug_info()})
+    body = {"is_read": is_read}
+    return await _request("PATCH", f"/alerts/{alert_id}", body=body)
+
+
+@mcp.tool()
+@_tool
+async def marketbot_dashboard(limit: int = 20, trends_limit: int = 10) -> Dict[str, Any]:
+    """Snapshot companies, trending keywords, and unread alerts in one call.
+
+    The three reads run concurrently, so this costs about one round-trip instead
+    of three back-to-back `list_competitors` / `list_trends` / `list_alerts` calls.
+    Each section carries the same payload those tools return (or its own error).
+
+    Args:
+        limit: Number of companies to include (default 20).
+        trends_limit: Number of ranked keywords to include (default 10).
+    """
+    results = await asyncio.gather(
+        _cached_get("/competitors", params=_clean(limit=limit, offset=0)),
+        _cached_get("/trends", params={"limit": trends_limit}, ttl=_TRENDS_CACHE_TTL, swr=_TRENDS_CACHE_SWR),
+        _cached_get("/alerts", params={"unread_only": "true"}),
+        return_exceptions=True,
+    )
+    response: Dict[str, Any] = {"success": True}
+    for section, result in zip(("competitors", "trends", "alerts"), results):
+        if isinstance(result, _TOOL_ERRORS):
+            response["success"] = False
+            response[section] = {"success": False, "error": str(result)}
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            response[section] = result
+    if not response["success"]:
+        response["debug"] = _debug_info()
+    return response
 
 
 if __name__ == "__main__":
     # Match other MCP tools: run the server over stdio for the Codex harness.
-    mcp.run(transport="stdio")
+    try:
+        import uvloop  # noqa: F401 - only probed; anyio installs the loop
+    except ImportError:
+        mcp.run(transport="stdio")
+    else:
+        # libuv-backed loop: cheaper wakeups for gathered HTTP calls.
+        anyio.run(mcp.run_stdio_async, backend_options={"use_uvloop": True})
@@ -11,8 +11,9 @@ tools. Changes take effect on the next container restart.
 from __future__ import annotations
 
 import logging
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from mcp.server.fastmcp import FastMCP
 
@@ -38,31 +39,43 @@ WORKSPACE_CONFIG = Path("/workspace/.codex-mcp.config")
 DEFAULT_CONFIG = MCP_SOURCE / ".codex-mcp.config"
 
 
-def _list_available_tools() -> List[str]:
-    """List all MCP tools available in the image."""
-    if not MCP_SOURCE.exists():
+# Directory listings keyed by path; reused while the directory's
+# (st_mtime_ns, st_ino, st_size) signature is unchanged.
+_LISTING_CACHE: Dict[Path, Tuple[Tuple[int, int, int], List[str]]] = {}
+
+
+def _list_tool_files(directory: Path) -> List[str]:
+    """List tool modules (*.py, excluding _-prefixed helpers) in a directory."""
+    try:
+        st = os.stat(directory)
+    except OSError:
         return []
 
-    tools = []
-    for f in sorted(MCP_SOURCE.glob("*.py")):
-        # Skip helper modules (prefixed with _)
-        if not f.name.startswith("_"):
-            tools.append(f.name)
+    signature = (st.st_mtime_ns, st.st_ino, st.st_size)
+    cached = _LISTING_CACHE.get(directory)
+    if cached is not None and cached[0] == signature:
+        return list(cached[1])
 
-    return tools
+    with os.scandir(directory) as entries:
+        tools = sorted(
+            entry.name
+            for entry in entries
+            # Skip helper modules (prefixed with _)
+            if entry.name.endswith(".py") and not entry.name.startswith("_")
+        )
 
+    _LISTING_CACHE[directory] = (signature, tools)
+    return list(tools)
 
-def _list_installed_tools() -> List[str]:
-    """List currently installed MCP tools."""
-    if not MCP_DEST.exists():
-        return []
 
-    tools = []
-    for f in sorted(MCP_DEST.glob("*.py")):
-        if not f.name.startswith("_"):
-            tools.append(f.name)
+def _list_available_tools() -> List[str]:
+    """List all MCP tools available in the image."""
+    return _list_tool_files(MCP_SOURCE)
 
-    return tools
+
+def _list_installed_tools() -> List[str]:
+    """List currently installed MCP tools."""
+    return _list_tool_files(MCP_DEST)
 
 
 def _read_config(config_path: Path) -> List[str]:
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Check that a marketbot read issued after a write never sees pre-write data.
+
+Starts a local stub of the MarketBot API whose first GET /competitors is slow,
+so it is still in flight when create_competitor succeeds. A list_competitors
+call made after the write must not join that in-flight GET (or reuse its
+result from the cache); it has to return the new company.
+
+Needs the MCP runtime deps (aiohttp, mcp) installed; no real API is used.
+"""
+
+import asyncio
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+MARKETBOT_PATH = Path(__file__).resolve().parent.parent / "MCP" / "marketbot.py"
+SLOW_GET_SECONDS = 0.5
+
+
+class _StubApi(BaseHTTPRequestHandler):
+    companies = []
+    gets = 0
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        # Snapshot before sleeping: the slow read reflects pre-write state.
+        snapshot = list(_StubApi.companies)
+        _StubApi.gets += 1
+        if _StubApi.gets == 1:
+            time.sleep(SLOW_GET_SECONDS)
+        self._reply({"success": True, "competitors": snapshot})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        company = json.loads(self.rfile.read(length) or b"{}")
+        _StubApi.companies.append(company["name"])
+        self._reply({"success": True, "competitor": company})
+
+
+def _load_marketbot(base_url):
+    os.environ["MARKETBOT_API_URL"] = base_url
+    os.environ["MARKETBOT_API_KEY"] = "test-key"
+    os.environ["MARKETBOT_TEAM_ID"] = "test-team"
+    os.environ["MARKETBOT_ENV_FILE"] = os.devnull
+    spec = importlib.util.spec_from_file_location("marketbot", MARKETBOT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["marketbot"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+async def _read_after_write(marketbot):
+    before = asyncio.create_task(marketbot.list_competitors())
+    await asyncio.sleep(SLOW_GET_SECONDS / 5)  # let the first GET reach the stub
+    created = await marketbot.create_competitor("Acme", "https://acme.test", "Widgets")
+    after = await marketbot.list_competitors()
+    await before
+    again = await marketbot.list_competitors()
+    await marketbot._get_session().close()
+    return created, after, again
+
+
+def test_read_after_write_sees_write():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubApi)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        marketbot = _load_marketbot(f"http://127.0.0.1:{server.server_address[1]}")
+        created, after, again = asyncio.run(_read_after_write(marketbot))
+    finally:
+        server.shutdown()
+
+    assert created["success"], created
+    assert after["competitors"] == ["Acme"], after
+    # The slow pre-write GET must not have been cached over the fresh result.
+    assert again["competitors"] == ["Acme"], again
+
+
+def main():
+    test_read_after_write_sees_write()
+    print("ok: read after write returned the new company")
+
+
+if __name__ == "__main__":
+    main()